@@ -1,13 +1,35 @@
+import multiprocessing
 import tkinter as tk
-from tkinter import filedialog
+from tkinter import filedialog, messagebox
 from map_pcd import PointCloudAndTrajectoryVisualizer
 
 
+def _is_number(text):
+    # Accept intermediate states while the user is still typing
+    if text in ('', '-', '.', '-.'):
+        return True
+    try:
+        float(text)
+        return True
+    except ValueError:
+        return False
+
+
+def _render_entry(pcd_file, csv_files, params):
+    # Runs in a spawned process: build the visualizer there so the plot
+    # window gets its own event loop and never blocks the Tk mainloop
+    visualizer = PointCloudAndTrajectoryVisualizer(pcd_file, csv_files)
+    visualizer.visualize(**params)
+
+
 class VisualizerGUI:
     def __init__(self, root):
         self.root = root
         self.root.title("Point Cloud and Trajectory Visualizer")
 
+        # Keystroke validator shared by every numeric entry
+        self.vcmd = (root.register(_is_number), '%P')
+
         # Select files
         self.pcd_file_path = tk.StringVar()
         self.csv_files = []
@@ -50,33 +72,41 @@ class VisualizerGUI:
         self.zoom = tk.DoubleVar(value=1.5)
 
         tk.Label(param_frame, text="Voxel size:").grid(row=0, column=0)
-        tk.Entry(param_frame, textvariable=self.voxel_size).grid(row=0, column=1)
+        tk.Entry(param_frame, textvariable=self.voxel_size, validate='key', validatecommand=self.vcmd).grid(row=0, column=1)
 
         tk.Label(param_frame, text="Point cloud color:").grid(row=1, column=0)
         tk.Entry(param_frame, textvariable=self.point_color).grid(row=1, column=1)
 
         tk.Label(param_frame, text="Point cloud transparency:").grid(row=2, column=0)
-        tk.Entry(param_frame, textvariable=self.point_cloud_alpha).grid(row=2, column=1)
+        tk.Entry(param_frame, textvariable=self.point_cloud_alpha, validate='key', validatecommand=self.vcmd).grid(row=2, column=1)
 
         tk.Label(param_frame, text="Elevation angle:").grid(row=3, column=0)
-        tk.Entry(param_frame, textvariable=self.elev).grid(row=3, column=1)
+        tk.Entry(param_frame, textvariable=self.elev, validate='key', validatecommand=self.vcmd).grid(row=3, column=1)
 
         tk.Label(param_frame, text="Azimuth angle:").grid(row=4, column=0)
-        tk.Entry(param_frame, textvariable=self.azim).grid(row=4, column=1)
+        tk.Entry(param_frame, textvariable=self.azim, validate='key', validatecommand=self.vcmd).grid(row=4, column=1)
 
         tk.Label(param_frame, text="Zoom level:").grid(row=5, column=0)
-        tk.Entry(param_frame, textvariable=self.zoom).grid(row=5, column=1)
+        tk.Entry(param_frame, textvariable=self.zoom, validate='key', validatecommand=self.vcmd).grid(row=5, column=1)
 
         # Visualization button
         tk.Button(root, text="Visualize", command=self.visualize).pack(pady=10)
 
+    def _pick_file(self, var, filetypes):
+        # The dialog is modal and must run on the Tk main loop; schedule it
+        # with after so the button callback returns before it opens
+        def ask():
+            file_path = filedialog.askopenfilename(filetypes=filetypes)
+            if file_path:
+                var.set(file_path)
+
+        self.root.after(0, ask)
+
     def select_pcd_file(self):
-        file_path = filedialog.askopenfilename(filetypes=[("PCD files", "*.pcd")])
-        self.pcd_file_path.set(file_path)
+        self._pick_file(self.pcd_file_path, [("PCD files", "*.pcd")])
 
     def select_csv_file(self, index):
-        file_path = filedialog.askopenfilename(filetypes=[("CSV files", "*.csv")])
-        self.csv_vars[index].set(file_path)
+        self._pick_file(self.csv_vars[index], [("CSV files", "*.csv")])
 
     def add_csv_input(self, index=None):
         if index is None:
@@ -97,7 +127,7 @@ class VisualizerGUI:
         tk.Button(csv_row_frame, text="Select CSV file", command=lambda i=len(self.csv_vars): self.select_csv_file(i)).pack(side=tk.LEFT, padx=5)
 
         tk.Label(csv_row_frame, text=f"Number of rows {index}:").pack(side=tk.LEFT, padx=5)
-        tk.Entry(csv_row_frame, textvariable=row_var, width=5).pack(side=tk.LEFT, padx=5)
+        tk.Entry(csv_row_frame, textvariable=row_var, width=5, validate='key', validatecommand=self.vcmd).pack(side=tk.LEFT, padx=5)
 
         tk.Label(csv_row_frame, text=f"Line color {index}:").pack(side=tk.LEFT, padx=5)
         tk.Entry(csv_row_frame, textvariable=line_color_var, width=5).pack(side=tk.LEFT, padx=5)
@@ -106,10 +136,10 @@ class VisualizerGUI:
         tk.Entry(csv_row_frame, textvariable=trajectory_point_color_var, width=5).pack(side=tk.LEFT, padx=5)
 
         tk.Label(csv_row_frame, text=f"Trajectory point size {index}:").pack(side=tk.LEFT, padx=5)
-        tk.Entry(csv_row_frame, textvariable=trajectory_point_size_var, width=5).pack(side=tk.LEFT, padx=5)
+        tk.Entry(csv_row_frame, textvariable=trajectory_point_size_var, width=5, validate='key', validatecommand=self.vcmd).pack(side=tk.LEFT, padx=5)
 
         tk.Label(csv_row_frame, text=f"Line width {index}:").pack(side=tk.LEFT, padx=5)
-        tk.Entry(csv_row_frame, textvariable=line_width_var, width=5).pack(side=tk.LEFT, padx=5)
+        tk.Entry(csv_row_frame, textvariable=line_width_var, width=5, validate='key', validatecommand=self.vcmd).pack(side=tk.LEFT, padx=5)
 
         self.csv_vars.append(csv_var)
         self.row_vars.append(row_var)
@@ -134,27 +164,44 @@ class VisualizerGUI:
     def visualize(self):
         pcd_file = self.pcd_file_path.get()
         csv_files = [var.get() for var in self.csv_vars if var.get()]
-        rows = [var.get() for var in self.row_vars]
+        # Validate every numeric entry before touching any heavy IO
+        try:
+            rows = [var.get() for var in self.row_vars]
+            trajectory_point_sizes = [var.get() for var in self.trajectory_point_size_vars]
+            line_widths = [var.get() for var in self.line_width_vars]
+            voxel_size = self.voxel_size.get()
+            point_cloud_alpha = self.point_cloud_alpha.get()
+            elev = self.elev.get()
+            azim = self.azim.get()
+            zoom = self.zoom.get()
+        except tk.TclError:
+            messagebox.showerror("Invalid input",
+                                 "One of the numeric parameters is not a valid number.")
+            return
         line_colors = [var.get() for var in self.line_color_vars]
         trajectory_point_colors = [var.get() for var in self.trajectory_point_color_vars]
-        trajectory_point_sizes = [var.get() for var in self.trajectory_point_size_vars]
-        line_widths = [var.get() for var in self.line_width_vars]
 
         if pcd_file and csv_files:
-            visualizer = PointCloudAndTrajectoryVisualizer(pcd_file, csv_files)
-            visualizer.visualize(
-                voxel_size=self.voxel_size.get(),
+            params = dict(
+                voxel_size=voxel_size,
                 point_color=self.point_color.get(),
-                point_cloud_alpha=self.point_cloud_alpha.get(),
-                elev=self.elev.get(),
-                azim=self.azim.get(),
-                zoom=self.zoom.get(),
+                point_cloud_alpha=point_cloud_alpha,
+                elev=elev,
+                azim=azim,
+                zoom=zoom,
                 rows=rows,
                 line_colors=line_colors,
                 trajectory_point_colors=trajectory_point_colors,
                 trajectory_point_sizes=trajectory_point_sizes,
                 line_widths=line_widths
             )
+            # Render in a separate process: matplotlib and Tk cannot share
+            # threads, and this keeps the GUI interactive with several
+            # plot windows open at once
+            ctx = multiprocessing.get_context('spawn')
+            ctx.Process(target=_render_entry,
+                        args=(pcd_file, csv_files, params),
+                        daemon=True).start()
 
 
 if __name__ == "__main__":
@@ -1,10 +1,149 @@
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
 import numpy as np
 import pandas as pd
 import open3d as o3d
 import matplotlib.pyplot as plt
-from scipy.interpolate import interp1d
-from matplotlib.colors import Normalize
+from scipy.interpolate import CubicSpline
 from mpl_toolkits.mplot3d import Axes3D
+from mpl_toolkits.mplot3d.art3d import Line3DCollection
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# 256-entry jet lookup table baked once at import, indexed with uint8 so the
+# height-gradient coloring is a single gather instead of a per-point colormap
+# interpolation
+_JET_LUT = plt.cm.jet(np.linspace(0.0, 1.0, 256)).astype(np.float32)
+
+
+@lru_cache(maxsize=32)
+def _xyz_cols(columns):
+    """Split column names into .x/.y/.z groups in one memoized pass"""
+    x_cols, y_cols, z_cols = [], [], []
+    for col in columns:
+        tail = col[-2:]
+        if tail == '.x':
+            x_cols.append(col)
+        elif tail == '.y':
+            y_cols.append(col)
+        elif tail == '.z':
+            z_cols.append(col)
+    return tuple(x_cols), tuple(y_cols), tuple(z_cols)
+
+
+def _cubic_interp_kernel(y, t_new):
+    """Not-a-knot cubic spline over unit-spaced knots, evaluated at t_new.
+
+    Matches SciPy's CubicSpline default boundary conditions so the result
+    is identical whether or not Numba is installed. Thomas-algorithm
+    tridiagonal solve plus direct evaluation, written so Numba can compile
+    it to one allocation-free numeric loop per axis.
+    """
+    n = y.shape[0]
+    dims = y.shape[1]
+    out = np.empty((t_new.shape[0], dims), dtype=np.float64)
+    second = np.empty(n, dtype=np.float64)
+    cp = np.empty(n, dtype=np.float64)
+    dp = np.empty(n, dtype=np.float64)
+
+    for d in range(dims):
+        # With unit spacing the not-a-knot conditions (continuous third
+        # derivative across the first and last interior knots) collapse the
+        # first and last interior equations to direct second differences
+        second[1] = y[2, d] - 2.0 * y[1, d] + y[0, d]
+        second[n - 2] = y[n - 1, d] - 2.0 * y[n - 2, d] + y[n - 3, d]
+
+        if n == 3:
+            # Single interior knot: the spline degenerates to a parabola
+            second[0] = second[1]
+            second[2] = second[1]
+        else:
+            if n == 5:
+                # One remaining unknown, solved directly
+                rhs = 6.0 * (y[3, d] - 2.0 * y[2, d] + y[1, d])
+                second[2] = (rhs - second[1] - second[3]) * 0.25
+            elif n > 5:
+                # Forward sweep of the (1, 4, 1) system for knots 2..n-3,
+                # with the known boundary values folded into the rhs
+                cp[2] = 0.25
+                dp[2] = (6.0 * (y[3, d] - 2.0 * y[2, d] + y[1, d]) - second[1]) * 0.25
+                for i in range(3, n - 3):
+                    rhs = 6.0 * (y[i + 1, d] - 2.0 * y[i, d] + y[i - 1, d])
+                    denom = 4.0 - cp[i - 1]
+                    cp[i] = 1.0 / denom
+                    dp[i] = (rhs - dp[i - 1]) / denom
+                rhs = 6.0 * (y[n - 2, d] - 2.0 * y[n - 3, d] + y[n - 4, d])
+                denom = 4.0 - cp[n - 4]
+                # Back substitution for the second derivatives
+                second[n - 3] = (rhs - second[n - 2] - dp[n - 4]) / denom
+                for i in range(n - 4, 1, -1):
+                    second[i] = dp[i] - cp[i] * second[i + 1]
+            # Extrapolate the end values from the not-a-knot conditions
+            second[0] = 2.0 * second[1] - second[2]
+            second[n - 1] = 2.0 * second[n - 2] - second[n - 3]
+
+        # Evaluate the piecewise cubic at the requested parameters
+        for j in range(t_new.shape[0]):
+            t = t_new[j]
+            i = int(t)
+            if i > n - 2:
+                i = n - 2
+            s = t - i
+            r = 1.0 - s
+            out[j, d] = (second[i] * r * r * r / 6.0
+                         + second[i + 1] * s * s * s / 6.0
+                         + (y[i, d] - second[i] / 6.0) * r
+                         + (y[i + 1, d] - second[i + 1] / 6.0) * s)
+
+    return out
+
+
+# Compile the kernel once when Numba is installed; otherwise fall back to
+# SciPy's CubicSpline in interpolate_trajectory
+_cubic_interp = njit(cache=True)(_cubic_interp_kernel) if njit is not None else None
+
+
+def _part1by2(x):
+    """Spread the low 10 bits of x so two zero bits separate each bit"""
+    x = x.astype(np.uint32) & np.uint32(0x3FF)
+    x = (x | (x << 16)) & np.uint32(0x030000FF)
+    x = (x | (x << 8)) & np.uint32(0x0300F00F)
+    x = (x | (x << 4)) & np.uint32(0x030C30C3)
+    x = (x | (x << 2)) & np.uint32(0x09249249)
+    return x
+
+
+def _morton_order(points):
+    """Permutation sorting points along a z-order (Morton) curve.
+
+    Strided slices of the reordered array are spatially representative, so
+    every k-th point forms a usable low-resolution preview of the cloud.
+    """
+    mins = points.min(axis=0)
+    scale = 1023.0 / (points.max(axis=0) - mins + 1e-12)
+    quantized = ((points - mins) * scale).astype(np.uint32)
+    codes = (_part1by2(quantized[:, 0])
+             | (_part1by2(quantized[:, 1]) << 1)
+             | (_part1by2(quantized[:, 2]) << 2))
+    return np.argsort(codes)
+
+
+def _height_colors(z):
+    """Map z-coordinates to jet RGBA colors through the precomputed LUT"""
+    # Compact the strided z column once so every pass below is contiguous
+    z = np.ascontiguousarray(z, dtype=np.float32)
+    # One min and one max pass, reused for the scale and the shift
+    z_min = z.min()
+    z_max = z.max()
+    inv = np.float32(255.0 / (z_max - z_min + 1e-12))
+    idx = ((z - z_min) * inv).astype(np.uint8)
+    return _JET_LUT[idx]
 
 
 class PointCloudAndTrajectoryVisualizer:
@@ -13,100 +152,265 @@ class PointCloudAndTrajectoryVisualizer:
         self.pcd_file_path = pcd_file_path
         # The paths of the CSV files
         self.csv_file_paths = csv_file_paths
+        # Cache for the raw point coordinates, keyed by (path, mtime)
+        self._raw_points = None
+        self._raw_key = None
+        # Cache for downsampled point arrays, keyed by (raw key, voxel size)
+        self._ds_cache = {}
+        # Figure and axes reused across visualize calls
+        self._fig = None
+        self._ax = None
+        # Event-handler ids and blit background of the current render
+        self._cids = []
+        self._bg = None
 
     def read_pcd_file(self, voxel_size=0.0):
-        # Read the point cloud from the PCD file
-        pcd = o3d.io.read_point_cloud(self.pcd_file_path)
+        # Re-read the PCD file only when the path or its mtime changed
+        raw_key = (self.pcd_file_path, os.path.getmtime(self.pcd_file_path))
+        if raw_key != self._raw_key:
+            # Try the zero-copy binary parser before Open3D's generic loader
+            points = self.read_pcd_binary(self.pcd_file_path)
+            if points is None:
+                points = np.asarray(o3d.io.read_point_cloud(self.pcd_file_path).points)
+            self._raw_points = points
+            self._raw_key = raw_key
+            # Invalidate downsampled results built from the old cloud
+            self._ds_cache.clear()
+
+        # Reuse a previously downsampled array for the same voxel size
+        key = (raw_key, voxel_size)
+        if key not in self._ds_cache:
+            points = self._raw_points
+            # Apply voxel downsampling
+            if voxel_size > 0:
+                if o3d.core.cuda.is_available():
+                    # Run the voxel hashing on the GPU via the tensor API
+                    tpcd = o3d.t.geometry.PointCloud(o3d.core.Tensor(points)).cuda()
+                    tpcd = tpcd.voxel_down_sample(voxel_size)
+                    points = tpcd.point['positions'].cpu().numpy()
+                else:
+                    # Fall back to the legacy CPU hash grid
+                    pcd = o3d.geometry.PointCloud(o3d.utility.Vector3dVector(points))
+                    points = np.asarray(pcd.voxel_down_sample(voxel_size=voxel_size).points)
+            self._ds_cache[key] = np.array(points, dtype=np.float64, order='C')
+
+        return self._ds_cache[key]
+
+    def read_pcd_binary(self, path):
+        """Read an uncompressed binary PCD's xyz fields via mmap.
+
+        Returns an (N, 3) float64 array, or None when the file is ASCII or
+        compressed so the caller can fall back to Open3D's loader.
+        """
+        type_map = {('F', 4): '<f4', ('F', 8): '<f8',
+                    ('I', 1): '<i1', ('I', 2): '<i2', ('I', 4): '<i4',
+                    ('U', 1): '<u1', ('U', 2): '<u2', ('U', 4): '<u4'}
 
-        # Apply voxel downsampling
-        if voxel_size > 0:
-            pcd = pcd.voxel_down_sample(voxel_size=voxel_size)
+        with open(path, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                # Parse the ASCII header up to the DATA line
+                fields = sizes = types = counts = None
+                num_points = None
+                offset = 0
+                while True:
+                    end = mm.find(b'\n', offset)
+                    if end < 0:
+                        return None
+                    line = mm[offset:end].decode('ascii', 'replace').strip()
+                    offset = end + 1
+                    if line.startswith('#'):
+                        continue
+                    keyword, _, rest = line.partition(' ')
+                    if keyword == 'FIELDS':
+                        fields = rest.split()
+                    elif keyword == 'SIZE':
+                        sizes = [int(v) for v in rest.split()]
+                    elif keyword == 'TYPE':
+                        types = rest.split()
+                    elif keyword == 'COUNT':
+                        counts = [int(v) for v in rest.split()]
+                    elif keyword == 'POINTS':
+                        num_points = int(rest)
+                    elif keyword == 'DATA':
+                        if rest.strip() != 'binary':
+                            return None
+                        break
 
-        return np.asarray(pcd.points)
+                if fields is None or sizes is None or types is None or num_points is None:
+                    return None
+                if not {'x', 'y', 'z'} <= set(fields):
+                    return None
+                if counts is None:
+                    counts = [1] * len(fields)
+
+                # Compile the record layout into a structured dtype
+                record = []
+                for name, type_char, size, count in zip(fields, types, sizes, counts):
+                    base = type_map.get((type_char, size))
+                    if base is None:
+                        return None
+                    record.append((name, base) if count == 1 else (name, base, (count,)))
+                dtype = np.dtype(record)
+
+                # One zero-copy view over the payload, then slice out xyz;
+                # the stack materializes a copy so the view can be dropped
+                # before the mmap is closed
+                data = np.frombuffer(mm, dtype=dtype, count=num_points, offset=offset)
+                points = np.stack([data['x'], data['y'], data['z']], axis=1).astype(np.float64)
+                del data
+                return points
+            finally:
+                mm.close()
 
     def read_csv_file(self, csv_file_path, row):
-        # Read the CSV file into a DataFrame
-        df = pd.read_csv(csv_file_path)
-        # Find all column names ending with '.x', '.y', '.z'
-        x_cols = [col for col in df.columns if col.endswith('.x')]
-        y_cols = [col for col in df.columns if col.endswith('.y')]
-        z_cols = [col for col in df.columns if col.endswith('.z')]
-
-        num_points = len(x_cols)
-        trajectory_points = []
-        for i in range(num_points):
-            x = df.at[row, x_cols[i]]
-            y = df.at[row, y_cols[i]]
-            z = df.at[row, z_cols[i]]
-            trajectory_points.append([x, y, z])
-
-        return np.array(trajectory_points)
+        # Read only the header to discover the coordinate columns
+        header = pd.read_csv(csv_file_path, nrows=0)
+        # Classify the '.x'/'.y'/'.z' columns, memoized per schema
+        x_cols, y_cols, z_cols = _xyz_cols(tuple(header.columns))
+        x_cols, y_cols, z_cols = list(x_cols), list(y_cols), list(z_cols)
 
-    def interpolate_trajectory(self, trajectory_points, num_interpolation_points=100):
-        # Create an array of indices for the original trajectory points
-        t = np.arange(len(trajectory_points))
-        # Create interpolation functions for x, y, and z coordinates
-        f_x = interp1d(t, trajectory_points[:, 0], kind='cubic')
-        f_y = interp1d(t, trajectory_points[:, 1], kind='cubic')
-        f_z = interp1d(t, trajectory_points[:, 2], kind='cubic')
+        # Parse only the requested row and the coordinate columns
+        df = pd.read_csv(csv_file_path, usecols=x_cols + y_cols + z_cols,
+                         skiprows=range(1, row + 1), nrows=1,
+                         dtype=np.float64, engine='c')
+
+        # Gather each coordinate group in one vectorized pass
+        xs = df[x_cols].to_numpy().ravel()
+        ys = df[y_cols].to_numpy().ravel()
+        zs = df[z_cols].to_numpy().ravel()
 
+        return np.stack([xs, ys, zs], axis=1)
+
+    def _load_trajectories(self, rows):
+        """Read and interpolate all trajectories, overlapping the CSV parses"""
+        def load(args):
+            csv_file_path, row = args
+            trajectory_points = self.read_csv_file(csv_file_path, row)
+            return trajectory_points, self.interpolate_trajectory(trajectory_points)
+
+        # The pandas C parser releases the GIL, so threads overlap the IO+parse
+        with ThreadPoolExecutor(max_workers=min(8, max(1, len(self.csv_file_paths)))) as executor:
+            return list(executor.map(load, zip(self.csv_file_paths, rows)))
+
+    def interpolate_trajectory(self, trajectory_points, num_interpolation_points=100):
         # Create a new array of indices for interpolation
         t_new = np.linspace(0, len(trajectory_points) - 1, num_interpolation_points)
-        # Interpolate the trajectory points
-        interpolated_trajectory = np.column_stack((f_x(t_new), f_y(t_new), f_z(t_new)))
 
-        return interpolated_trajectory
+        # Use the Numba kernel when available; it skips all SciPy object setup
+        if _cubic_interp is not None and len(trajectory_points) >= 3:
+            points = np.ascontiguousarray(trajectory_points, dtype=np.float64)
+            return _cubic_interp(points, t_new)
+
+        # Create an array of indices for the original trajectory points
+        t = np.arange(len(trajectory_points))
+        # Build one cubic spline over all three coordinates at once
+        cs = CubicSpline(t, trajectory_points, axis=0)
+        # Interpolate the trajectory points
+        return cs(t_new)
 
     def visualize(self, voxel_size=0.0, point_color='height_gradient',
                   point_cloud_alpha=0.5, elev=30, azim=45, zoom=1.0,
                   rows=[6], line_colors=['r'], trajectory_point_colors=['b'],
-                  trajectory_point_sizes=[5], line_widths=[2]):
+                  trajectory_point_sizes=[5], line_widths=[2], backend='mpl',
+                  batch=False, out_path='visualization.png', dpi=150):
+        # Batch renders skip the windowing layer entirely
+        if batch:
+            import matplotlib
+            matplotlib.use('Agg', force=True)
+
         # Read the point cloud from the PCD file
         point_cloud = self.read_pcd_file(voxel_size)
 
-        # Create a new figure
-        fig = plt.figure(figsize=(10, 8))
-        # Add a 3D subplot to the figure
-        ax = fig.add_subplot(111, projection='3d')
+        # Render through the OpenGL backend when requested
+        if backend == 'gl':
+            try:
+                self._visualize_gl(point_cloud, point_color, point_cloud_alpha,
+                                   rows, line_colors, trajectory_point_colors,
+                                   trajectory_point_sizes, line_widths)
+                return
+            except ImportError:
+                # Fall back to matplotlib when pyqtgraph is unavailable
+                pass
+
+        # Downcast to float32 to halve memory traffic through the renderer
+        point_cloud = np.ascontiguousarray(point_cloud, dtype=np.float32)
+        # Morton-sort so strided slices stay spatially representative for LOD
+        point_cloud = point_cloud[_morton_order(point_cloud)]
+
+        # Reuse the cached figure and axes when the window is still alive
+        if self._fig is None or not plt.fignum_exists(self._fig.number):
+            # Create a new figure
+            self._fig = plt.figure(figsize=(10, 8))
+            # Add a 3D subplot to the figure
+            self._ax = self._fig.add_subplot(111, projection='3d')
+            new_figure = True
+        else:
+            # Drop the previous call's event handlers before clearing the
+            # axes, or the stale callbacks would draw detached artists
+            for cid in self._cids:
+                self._fig.canvas.mpl_disconnect(cid)
+            # Clear the existing axes instead of rebuilding them
+            self._ax.cla()
+            new_figure = False
+        self._cids = []
+        self._bg = None
+        fig, ax = self._fig, self._ax
 
         # Plot the semi-transparent point cloud
         if point_color == 'height_gradient':
-            # Normalize the z-coordinates of the point cloud
-            norm = Normalize(vmin=np.min(point_cloud[:, 2]), vmax=np.max(point_cloud[:, 2]))
-            # Map the normalized z-coordinates to colors using the jet colormap
-            colors = plt.cm.jet(norm(point_cloud[:, 2]))
+            # Color by height through the precomputed jet LUT
+            colors = _height_colors(point_cloud[:, 2])
             # Plot the point cloud with color based on height
-            ax.scatter(point_cloud[:, 0], point_cloud[:, 1], point_cloud[:, 2],
-                       c=colors, alpha=point_cloud_alpha)
+            pcd_artist = ax.scatter(point_cloud[:, 0], point_cloud[:, 1], point_cloud[:, 2],
+                                    c=colors, alpha=point_cloud_alpha)
         else:
             # Plot the point cloud with a single color
-            ax.scatter(point_cloud[:, 0], point_cloud[:, 1], point_cloud[:, 2],
-                       c=point_color, alpha=point_cloud_alpha)
+            colors = None
+            pcd_artist = ax.scatter(point_cloud[:, 0], point_cloud[:, 1], point_cloud[:, 2],
+                                    c=point_color, alpha=point_cloud_alpha)
 
-        # Plot multiple trajectories
-        for csv_file_path, row, line_color, trajectory_point_color, trajectory_point_size, line_width in zip(
-                self.csv_file_paths, rows, line_colors, trajectory_point_colors, trajectory_point_sizes, line_widths):
-            # Read the trajectory points from the CSV file
-            trajectory_points = self.read_csv_file(csv_file_path, row)
-            # Interpolate the trajectory points
-            interpolated_trajectory = self.interpolate_trajectory(trajectory_points)
+        # Load all trajectories in parallel, then draw in the main thread
+        trajectories = self._load_trajectories(rows)
 
-            # Plot the original trajectory points
-            ax.scatter(trajectory_points[:, 0], trajectory_points[:, 1], trajectory_points[:, 2],
-                       c=trajectory_point_color, s=trajectory_point_size, alpha=1.0, zorder=3)
+        # Batch all trajectories into one scatter artist and one line
+        # collection instead of one pair of artists per trajectory
+        point_list, point_color_list, point_size_list = [], [], []
+        segments, segment_colors, segment_widths = [], [], []
+        for (trajectory_points, interpolated_trajectory), line_color, trajectory_point_color, trajectory_point_size, line_width in zip(
+                trajectories, line_colors, trajectory_point_colors, trajectory_point_sizes, line_widths):
+            point_list.append(trajectory_points)
+            point_color_list.extend([trajectory_point_color] * len(trajectory_points))
+            point_size_list.extend([trajectory_point_size] * len(trajectory_points))
+            segments.append(interpolated_trajectory)
+            segment_colors.append(line_color)
+            segment_widths.append(line_width)
 
-            # Plot the interpolated trajectory line
-            ax.plot(interpolated_trajectory[:, 0], interpolated_trajectory[:, 1], interpolated_trajectory[:, 2],
-                    c=line_color, linewidth=line_width, alpha=1.0, zorder=4)
+        trajectory_artists = []
+        if point_list:
+            # Plot the original trajectory points in a single draw
+            all_points = np.concatenate(point_list)
+            trajectory_artists.append(
+                ax.scatter(all_points[:, 0], all_points[:, 1], all_points[:, 2],
+                           c=point_color_list, s=point_size_list, alpha=1.0, zorder=3))
+
+            # Plot all interpolated trajectory lines as one collection
+            line_collection = Line3DCollection(segments, colors=segment_colors,
+                                               linewidths=segment_widths,
+                                               alpha=1.0, zorder=4)
+            ax.add_collection3d(line_collection)
+            trajectory_artists.append(line_collection)
+
+        # Blit the static point cloud so drags redraw only the trajectories
+        self._setup_blitting(fig, ax, trajectory_artists)
+        # Drop to a strided LOD of the cloud while the user is dragging
+        self._setup_lod(fig, pcd_artist, point_cloud, colors)
 
         # Set the initial view angle
         ax.view_init(elev=elev, azim=azim)
 
-        # Set the axis ratio to 1:1:1
-        self.set_axes_equal(ax)
-
-        # Set the zoom level
-        self.set_zoom(ax, zoom)
+        # Set the axis ratio to 1:1:1 and apply the zoom in one pass
+        self._apply_view(ax, zoom)
 
         # Set the labels for the axes
         ax.set_xlabel('X')
@@ -115,54 +419,134 @@ class PointCloudAndTrajectoryVisualizer:
         # Set the title of the plot
         ax.set_title(f'Point cloud downsampling rate: {voxel_size}')
 
-        # Display the plot
-        plt.show()
+        if batch:
+            # Save straight to disk and release the figure's memory
+            fig.savefig(out_path, dpi=dpi)
+            plt.close(fig)
+            self._fig = self._ax = None
+        elif new_figure:
+            # Display the plot
+            plt.show()
+        else:
+            # Refresh the already-open window
+            fig.canvas.draw_idle()
+
+    def _setup_blitting(self, fig, ax, dynamic_artists):
+        """Cache the static point cloud layer and blit only the trajectories"""
+        # The dynamic artists are excluded from ordinary draws so the
+        # cached background contains the point cloud alone
+        for artist in dynamic_artists:
+            artist.set_animated(True)
 
-    def set_axes_equal(self, ax):
-        """Set the axis ratio in 3D plotting to 1:1:1"""
-        # Get the current axis limits
-        x_limits = ax.get_xlim3d()
-        y_limits = ax.get_ylim3d()
-        z_limits = ax.get_zlim3d()
+        def on_draw(event):
+            # A full draw just rendered the static layer; snapshot it
+            self._bg = fig.canvas.copy_from_bbox(ax.bbox)
+            for artist in dynamic_artists:
+                ax.draw_artist(artist)
+
+        def on_motion(event):
+            if self._bg is None:
+                return
+            # Restore the cached point cloud and redraw only trajectories
+            fig.canvas.restore_region(self._bg)
+            for artist in dynamic_artists:
+                ax.draw_artist(artist)
+            fig.canvas.blit(ax.bbox)
+
+        self._cids.append(fig.canvas.mpl_connect('draw_event', on_draw))
+        self._cids.append(fig.canvas.mpl_connect('motion_notify_event', on_motion))
+
+    def _setup_lod(self, fig, artist, points, colors, stride=10):
+        """Swap the cloud to every stride-th point while a drag is active"""
+        # The Morton ordering makes the strided subset a coarse preview
+        full_offsets = (points[:, 0], points[:, 1], points[:, 2])
+        coarse_offsets = (points[::stride, 0], points[::stride, 1], points[::stride, 2])
+
+        def on_press(event):
+            artist._offsets3d = coarse_offsets
+            if colors is not None:
+                artist.set_facecolor(colors[::stride])
+            fig.canvas.draw_idle()
+
+        def on_release(event):
+            # Refine back to the full cloud once the drag ends
+            artist._offsets3d = full_offsets
+            if colors is not None:
+                artist.set_facecolor(colors)
+            fig.canvas.draw_idle()
 
-        # Calculate the range and center point of each axis
-        x_range = abs(x_limits[1] - x_limits[0])
-        x_middle = np.mean(x_limits)
-        y_range = abs(y_limits[1] - y_limits[0])
-        y_middle = np.mean(y_limits)
-        z_range = abs(z_limits[1] - z_limits[0])
-        z_middle = np.mean(z_limits)
+        self._cids.append(fig.canvas.mpl_connect('button_press_event', on_press))
+        self._cids.append(fig.canvas.mpl_connect('button_release_event', on_release))
 
-        # Adjust the axis range to make them equal
-        plot_radius = 0.5 * max([x_range, y_range, z_range])
+    def _visualize_gl(self, point_cloud, point_color, point_cloud_alpha,
+                      rows, line_colors, trajectory_point_colors,
+                      trajectory_point_sizes, line_widths):
+        """Draw the point cloud and trajectories with pyqtgraph's OpenGL view"""
+        import pyqtgraph.opengl as gl
+        from pyqtgraph.Qt import QtWidgets
+        from matplotlib.colors import to_rgba
 
-        ax.set_xlim3d([x_middle - plot_radius, x_middle + plot_radius])
-        ax.set_ylim3d([y_middle - plot_radius, y_middle + plot_radius])
-        ax.set_zlim3d([z_middle - plot_radius, z_middle + plot_radius])
+        # Reuse the running Qt application if one exists
+        app = QtWidgets.QApplication.instance()
+        if app is None:
+            app = QtWidgets.QApplication([])
 
-    def set_zoom(self, ax, zoom):
-        """Set the zoom level of the 3D plot"""
-        # Get the current axis limits
+        # Upload positions as float32 so the GPU gets a compact buffer
+        positions = np.ascontiguousarray(point_cloud, dtype=np.float32)
+
+        # Build one RGBA color per point
+        if point_color == 'height_gradient':
+            # Color by height through the precomputed jet LUT
+            colors = _height_colors(positions[:, 2])
+        else:
+            colors = np.tile(np.asarray(to_rgba(point_color), dtype=np.float32),
+                             (len(positions), 1))
+        colors[:, 3] = np.float32(point_cloud_alpha)
+
+        # One batched OpenGL draw for the whole point cloud
+        view = gl.GLViewWidget()
+        view.setWindowTitle('Point Cloud and Trajectory Visualizer')
+        view.addItem(gl.GLScatterPlotItem(pos=positions, color=colors,
+                                          size=2, pxMode=True))
+
+        # Add one scatter and one line item per trajectory
+        for (trajectory_points, interpolated_trajectory), line_color, trajectory_point_color, trajectory_point_size, line_width in zip(
+                self._load_trajectories(rows), line_colors, trajectory_point_colors, trajectory_point_sizes, line_widths):
+            view.addItem(gl.GLScatterPlotItem(
+                pos=trajectory_points.astype(np.float32),
+                color=to_rgba(trajectory_point_color),
+                size=trajectory_point_size, pxMode=True))
+            view.addItem(gl.GLLinePlotItem(
+                pos=interpolated_trajectory.astype(np.float32),
+                color=to_rgba(line_color), width=line_width, antialias=True))
+
+        # Center the camera on the point cloud
+        center = positions.mean(axis=0)
+        extent = float(np.linalg.norm(positions.max(axis=0) - positions.min(axis=0)))
+        view.pan(*center)
+        view.setCameraPosition(distance=extent)
+        view.show()
+        app.exec_()
+
+    def _apply_view(self, ax, zoom):
+        """Set the axis ratio to 1:1:1 and apply the zoom in a single pass"""
+        # Read each axis limit once; every get triggers a transform flush
         x_limits = ax.get_xlim3d()
         y_limits = ax.get_ylim3d()
         z_limits = ax.get_zlim3d()
 
-        # Calculate the center point of each axis
-        x_middle = np.mean(x_limits)
-        y_middle = np.mean(y_limits)
-        z_middle = np.mean(z_limits)
-
-        # Calculate the half range of each axis
-        x_half_range = abs(x_limits[1] - x_limits[0]) / 2
-        y_half_range = abs(y_limits[1] - y_limits[0]) / 2
-        z_half_range = abs(z_limits[1] - z_limits[0]) / 2
+        # Calculate the center point of each axis with plain scalar math
+        x_middle = (x_limits[0] + x_limits[1]) * 0.5
+        y_middle = (y_limits[0] + y_limits[1]) * 0.5
+        z_middle = (z_limits[0] + z_limits[1]) * 0.5
 
-        # Adjust the range according to the zoom level
-        x_half_range /= zoom
-        y_half_range /= zoom
-        z_half_range /= zoom
+        # Equal radius for all axes, scaled by the zoom level
+        plot_radius = 0.5 * max(abs(x_limits[1] - x_limits[0]),
+                                abs(y_limits[1] - y_limits[0]),
+                                abs(z_limits[1] - z_limits[0]))
+        half_range = plot_radius / zoom
 
         # Set the new axis limits
-        ax.set_xlim3d([x_middle - x_half_range, x_middle + x_half_range])
-        ax.set_ylim3d([y_middle - y_half_range, y_middle + y_half_range])
-        ax.set_zlim3d([z_middle - z_half_range, z_middle + z_half_range])
\ No newline at end of file
+        ax.set_xlim3d([x_middle - half_range, x_middle + half_range])
+        ax.set_ylim3d([y_middle - half_range, y_middle + half_range])
+        ax.set_zlim3d([z_middle - half_range, z_middle + half_range])
\ No newline at end of file